@@ -1,5 +1,6 @@
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
+from werkzeug.exceptions import NotFound
 import requests
 import json
 import os
@@ -7,9 +8,9 @@ import re
 from dotenv import load_dotenv
 from fir_prompt import build_prompt
 from pdf_generator import generate_pdf
-from database import get_db, init_db
+from database import get_db, init_db, allocate_lr_no
+from config import STORAGE_ROOT, PDF_DIR, IST
 from datetime import datetime
-import pytz
 
 
 
@@ -81,9 +82,17 @@ def safe():
 # =========================================================
 @app.route("/download/<path:filename>", methods=["GET"])
 def download_pdf(filename):
-    if not os.path.exists(filename):
+    # only stored paths (generated_fir/<name>.pdf) are served,
+    # send_from_directory rejects anything escaping the PDF store
+    prefix = f"{PDF_DIR}/"
+    if not filename.startswith(prefix):
+        return jsonify({"error": "PDF file not found"}), 404
+
+    pdf_dir = os.path.abspath(os.path.join(STORAGE_ROOT, PDF_DIR))
+    try:
+        return send_from_directory(pdf_dir, filename[len(prefix):], as_attachment=False)
+    except NotFound:
         return jsonify({"error": "PDF file not found"}), 404
-    return send_file(filename, as_attachment=False)
 
 
 # =========================================================
@@ -167,14 +176,13 @@ def generate_fir():
         fir_json["pincode"] = data.get("pincode")
 
         # ---------------- GENERATE PDF ----------------
-        pdf_path, lr_no = generate_pdf(fir_json)
+        pdf_path, lr_no = generate_pdf(fir_json, allocate_lr_no())
 
-        if not pdf_path or not os.path.exists(pdf_path):
+        if not pdf_path or not os.path.exists(os.path.join(STORAGE_ROOT, pdf_path)):
             return jsonify({"error": "PDF generation failed"}), 500
         
         # --------- CREATE IST TIMESTAMP ----------
-        ist = pytz.timezone("Asia/Kolkata")
-        created_at = datetime.now(ist).strftime("%Y-%m-%d %H:%M:%S")
+        created_at = datetime.now(IST).strftime("%Y-%m-%d %H:%M:%S")
 
         
         # ================= SAVE USER DATA + PDF PATH TO DB =================
@@ -265,7 +273,7 @@ def reset_system():
     conn.close()
 
     # delete PDFs
-    pdf_dir = "generated_fir"
+    pdf_dir = os.path.join(STORAGE_ROOT, PDF_DIR)
     if os.path.exists(pdf_dir):
         for f in os.listdir(pdf_dir):
             if f.lower().endswith(".pdf"):
@@ -0,0 +1,73 @@
+"""
+Multi-process check for LR number allocation.
+
+    python check_lr_numbers.py [processes] [numbers_per_process]
+    python check_lr_numbers.py --use-database-url   # against DATABASE_URL
+
+Uses a fresh SQLite DB in a temp dir. DATABASE_URL (environment or .env)
+is ignored unless --use-database-url is given, LR numbers drawn there
+are consumed for real. Every available start method
+(spawn / fork / forkserver) is run, all LR numbers must be unique.
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+
+
+def draw(count):
+    from database import allocate_lr_no
+    return [allocate_lr_no() for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-process LR number check")
+    parser.add_argument("processes", nargs="?", type=int, default=8)
+    parser.add_argument("count", nargs="?", type=int, default=50)
+    parser.add_argument(
+        "--use-database-url",
+        action="store_true",
+        help="draw from the DB in DATABASE_URL (consumes real LR numbers)",
+    )
+    args = parser.parse_args()
+    processes, count = args.processes, args.count
+
+    # must be set before config is imported, child processes inherit it.
+    # load_dotenv() never overrides a key that is already set, so an empty
+    # value also keeps a DATABASE_URL from .env out of the check
+    if not args.use_database_url:
+        os.environ["DATABASE_URL"] = ""
+    elif not os.getenv("DATABASE_URL"):
+        from dotenv import load_dotenv
+        load_dotenv()
+        if not os.getenv("DATABASE_URL"):
+            parser.error("--use-database-url needs DATABASE_URL to be set")
+
+    tmp_dir = tempfile.mkdtemp(prefix="fir_lr_check_")
+    os.environ["FIR_STORAGE_ROOT"] = tmp_dir
+    os.environ["FIR_DB_PATH"] = os.path.join(tmp_dir, "fir_records.db")
+    os.environ["LR_BLOCK_SIZE"] = "7"   # small blocks, many leases
+
+    from database import init_db
+    init_db()
+
+    seen = set()
+
+    for method in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context(method)
+        with ctx.Pool(processes) as pool:
+            results = pool.map(draw, [count] * processes)
+
+        numbers = [n for r in results for n in r]
+        assert len(numbers) == processes * count
+        assert len(set(numbers)) == len(numbers), f"{method}: duplicate LR numbers"
+        assert not seen & set(numbers), f"{method}: LR numbers reused across runs"
+        seen.update(numbers)
+
+        print(f"{method}: {processes} x {count} -> {len(set(numbers))} unique")
+
+    print("OK:", len(seen), "unique LR numbers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import os
+import pytz
+from dotenv import load_dotenv
+
+
+load_dotenv()
+
+
+# ================= STORAGE SETTINGS =================
+# Multi-node mode needs BOTH:
+#   FIR_STORAGE_ROOT -> volume shared by all nodes, holds the PDFs only
+#                       (PDF names are unique, so any shared mount works)
+#   DATABASE_URL     -> postgresql://... , LR numbers are leased from it
+STORAGE_ROOT = os.getenv("FIR_STORAGE_ROOT", ".")
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Without DATABASE_URL a local SQLite file is used, which is only safe for
+# processes on one host. It deliberately does NOT follow FIR_STORAGE_ROOT:
+# on NFS / SMB SQLite locking is unreliable and two nodes could lease
+# the same LR block.
+DB_PATH = os.getenv("FIR_DB_PATH", "fir_records.db")
+
+# relative to STORAGE_ROOT, this is what gets stored in fir_cases.pdf_path
+PDF_DIR = "generated_fir"
+
+
+# ================= LR NUMBER SETTINGS =================
+# LR year, PDF date and created_at all follow IST, not the server clock
+IST = pytz.timezone("Asia/Kolkata")
+
+# numbers leased per node in one go, unused ones are skipped (gaps are fine)
+LR_BLOCK_SIZE = int(os.getenv("LR_BLOCK_SIZE", "20"))
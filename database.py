@@ -1,20 +1,62 @@
 import sqlite3
 import os
+import threading
+from datetime import datetime
+from config import DATABASE_URL, DB_PATH, LR_BLOCK_SIZE, IST
+
+DB_NAME = DB_PATH
+
+
+class PgConnection:
+    """
+    Thin sqlite3-style wrapper so the same queries (with ? params)
+    run on PostgreSQL when DATABASE_URL is set
+    """
+    def __init__(self, url):
+        import psycopg
+        from psycopg.rows import dict_row
+
+        self.conn = psycopg.connect(url, row_factory=dict_row)
+
+    def execute(self, sql, params=()):
+        return self.conn.execute(sql.replace("?", "%s"), params)
+
+    def cursor(self):
+        return self
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
 
-DB_NAME = "fir_records.db"
 
 def get_db():
-    conn = sqlite3.connect(DB_NAME)
+    if DATABASE_URL:
+        return PgConnection(DATABASE_URL)
+
+    conn = sqlite3.connect(DB_NAME, timeout=30)
     conn.row_factory = sqlite3.Row
     return conn
 
 def init_db():
+    if DATABASE_URL:
+        id_column = "SERIAL PRIMARY KEY"
+        created_at_type = "TEXT"
+    else:
+        id_column = "INTEGER PRIMARY KEY AUTOINCREMENT"
+        created_at_type = "DATETIME"
+
+        db_dir = os.path.dirname(DB_NAME)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
     conn = get_db()
     cursor = conn.cursor()
 
-    cursor.execute("""
+    cursor.execute(f"""
     CREATE TABLE IF NOT EXISTS fir_cases (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id {id_column},
     lr_no TEXT UNIQUE,
     name TEXT NOT NULL,
     mobile TEXT,
@@ -22,10 +64,75 @@ def init_db():
     pincode TEXT,
     incident TEXT NOT NULL,
     pdf_path TEXT NOT NULL,
-    created_at DATETIME
+    created_at {created_at_type}
+    )
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS lr_sequences (
+    year INTEGER PRIMARY KEY,
+    next_value INTEGER NOT NULL
     )
     """)
 
 
     conn.commit()
     conn.close()
+
+
+# ================= LR NUMBER ALLOCATION =================
+_lr_lock = threading.Lock()
+_lr_block = {"pid": None, "year": None, "next": 0, "end": 0}
+
+
+def lease_lr_block(year, size=LR_BLOCK_SIZE):
+    """
+    Reserve the next `size` LR numbers of a year in the shared DB.
+    The upsert locks the year's row (PostgreSQL) or the whole DB
+    (SQLite, BEGIN IMMEDIATE) until commit, so two nodes
+    can never lease the same block
+    """
+    conn = get_db()
+    try:
+        if not DATABASE_URL:
+            conn.execute("BEGIN IMMEDIATE")
+
+        conn.execute("""
+        INSERT INTO lr_sequences (year, next_value) VALUES (?, ?)
+        ON CONFLICT(year) DO UPDATE
+        SET next_value = lr_sequences.next_value + ?
+        """, (year, 1 + size, size))
+
+        end = conn.execute(
+            "SELECT next_value FROM lr_sequences WHERE year = ?", (year,)
+        ).fetchone()["next_value"]
+
+        conn.commit()
+    finally:
+        conn.close()
+
+    return end - size, end
+
+
+def allocate_lr_no():
+    """
+    Next LR number for this process, e.g. 000123/2026.
+    Served from the leased block, a new block is leased when it runs out,
+    the year changes, or the process was forked
+    """
+    year = datetime.now(IST).year
+    pid = os.getpid()
+
+    with _lr_lock:
+        if (
+            _lr_block["pid"] != pid
+            or _lr_block["year"] != year
+            or _lr_block["next"] >= _lr_block["end"]
+        ):
+            start, end = lease_lr_block(year)
+            _lr_block.update(pid=pid, year=year, next=start, end=end)
+
+        seq = _lr_block["next"]
+        _lr_block["next"] += 1
+
+    return f"{seq:06d}/{year}"
@@ -1,10 +1,11 @@
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from datetime import datetime
-import uuid, os
-from textwrap import wrap
+import os
 import re
 from reportlab.lib.utils import ImageReader
+from text_layout import layout_lines, layout_boilerplate
+from config import STORAGE_ROOT, PDF_DIR, IST
 
 
 # ================= PAGE SETTINGS =================
@@ -54,42 +55,50 @@ def normalize_fir_text(text: str) -> str:
 
 
 # ================= TEXT WRAPPER =================
-def draw_paragraph(c, text, y, font="Times-Roman", size=10.5, leading=17):
+def draw_paragraph(c, text, y, font="Times-Roman", size=10.5, leading=17, boilerplate=False):
     """
-    Draw wrapped text safely across pages with proper spacing
+    Draw wrapped text safely across pages with proper spacing.
+    boilerplate=True caches the layout, only for fixed text
     """
     c.setFont(font, size)
     text_obj = c.beginText(LEFT_MARGIN, y)
+    text_obj.setLeading(leading)
+    current_font = font
 
-    max_chars = int(MAX_WIDTH / (size * 0.55))
+    layout = layout_boilerplate if boilerplate else layout_lines
 
-    for line in text.split("\n"):
-        wrapped_lines = wrap(line, max_chars) or [""]
-        for w in wrapped_lines:
-            if text_obj.getY() < BOTTOM_MARGIN:
-                c.drawText(text_obj)
-                c.showPage()
-                c.setFont(font, size)
-                text_obj = c.beginText(LEFT_MARGIN, TOP_MARGIN)
-            text_obj.textLine(w)
+    for line_font, line in layout(text, font, size, MAX_WIDTH):
+        if text_obj.getY() < BOTTOM_MARGIN:
+            c.drawText(text_obj)
+            c.showPage()
+            c.setFont(font, size)
+            text_obj = c.beginText(LEFT_MARGIN, TOP_MARGIN)
+            text_obj.setLeading(leading)
+            current_font = font
+
+        if line_font != current_font:
+            # setFont would reset leading to 1.2 x size
+            text_obj.setFont(line_font, size, leading)
+            current_font = line_font
+
+        text_obj.textLine(line)
 
     c.drawText(text_obj)
     return text_obj.getY() - 10
 
 
 # ================= MAIN PDF GENERATOR =================
-def generate_pdf(fir):
-    os.makedirs("generated_fir", exist_ok=True)
+def generate_pdf(fir, lr_no):
+    os.makedirs(os.path.join(STORAGE_ROOT, PDF_DIR), exist_ok=True)
 
-    file_id = uuid.uuid4().hex[:10].upper()
-    year = datetime.now().year
-    lr_no = f"{file_id}/{year}"
+    file_id = lr_no.replace("/", "_")
 
     filename = f"FIR_{file_id}.pdf"
 
-    path = f"generated_fir/{filename}"
+    # relative path is stored in DB, file lives under the storage root
+    path = f"{PDF_DIR}/{filename}"
 
-    c = canvas.Canvas(path, pagesize=A4)
+    c = canvas.Canvas(os.path.join(STORAGE_ROOT, path), pagesize=A4)
     y = TOP_MARGIN
 
     # ================= HEADER =================
@@ -126,11 +135,11 @@ def generate_pdf(fir):
 
 
     c.setFont("Times-Roman", 10)
-    c.drawString(LEFT_MARGIN, y, f"LR NO: {file_id}/2025")
+    c.drawString(LEFT_MARGIN, y, f"LR NO: {lr_no}")
     c.drawRightString(
         PAGE_WIDTH - RIGHT_MARGIN,
         y,
-        f"DATE: {datetime.now().strftime('%d/%m/%Y %I:%M %p')}"
+        f"DATE: {datetime.now(IST).strftime('%d/%m/%Y %I:%M %p')}"
     )
     y -= 35
     
@@ -236,7 +245,8 @@ def generate_pdf(fir):
         y,
         font="Times-Roman",
         size=9.5,
-        leading=15
+        leading=15,
+        boilerplate=True
     )
 
     # ================= DISCLAIMERS =================
@@ -252,7 +262,8 @@ def generate_pdf(fir):
         y,
         font="Times-Roman",
         size=9.5,
-        leading=15
+        leading=15,
+        boilerplate=True
     )
 
     # ================= FOOTER =================
@@ -0,0 +1,235 @@
+import os
+import re
+from functools import lru_cache
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+
+# ================= FONT SETTINGS =================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# relative paths are resolved against this file, not the working directory
+DEVANAGARI_FONT_NAME = "NotoSansDevanagari"
+DEVANAGARI_FONT_PATH = os.path.join(
+    BASE_DIR,
+    os.getenv("DEVANAGARI_FONT_PATH", "fonts/NotoSansDevanagari-Regular.ttf"),
+)
+
+DEVANAGARI_CHARS = re.compile(r"[ऀ-ॿ꣠-ꣿ]")
+
+
+# ================= FONT RESOLUTION =================
+@lru_cache(maxsize=None)
+def devanagari_font():
+    """
+    Register the Devanagari TTF once.
+    Returns None when the font file is not available.
+    """
+    if not os.path.exists(DEVANAGARI_FONT_PATH):
+        print(
+            "Devanagari font not found, Hindi text will not render:",
+            DEVANAGARI_FONT_PATH,
+        )
+        return None
+
+    try:
+        pdfmetrics.registerFont(TTFont(DEVANAGARI_FONT_NAME, DEVANAGARI_FONT_PATH))
+    except Exception as e:
+        print("Devanagari font skipped:", e)
+        return None
+
+    return DEVANAGARI_FONT_NAME
+
+
+def font_for_line(line, font):
+    """
+    Built-in Times fonts have no Devanagari glyphs,
+    so such lines switch to the registered TTF (if any)
+    """
+    if DEVANAGARI_CHARS.search(line):
+        return devanagari_font() or font
+    return font
+
+
+# ================= WIDTH TABLES =================
+@lru_cache(maxsize=None)
+def width_table(font, size):
+    """
+    Per-font, per-size character width table.
+    Latin-1 is precomputed, other characters are filled in on first use.
+    """
+    return {
+        chr(code): pdfmetrics.stringWidth(chr(code), font, size)
+        for code in range(32, 256)
+    }
+
+
+def text_width(text, font, size):
+    widths = width_table(font, size)
+    total = 0.0
+
+    for ch in text:
+        w = widths.get(ch)
+        if w is None:
+            w = widths[ch] = pdfmetrics.stringWidth(ch, font, size)
+        total += w
+
+    return total
+
+
+# ================= LINE BREAKER =================
+def split_long_word(word, font, size, max_width):
+    """
+    Hard-break a single word that is wider than the line
+    """
+    widths = width_table(font, size)
+    chunks = []
+    current = ""
+    current_w = 0.0
+
+    for ch in word:
+        w = widths.get(ch)
+        if w is None:
+            w = widths[ch] = pdfmetrics.stringWidth(ch, font, size)
+
+        if current and current_w + w > max_width:
+            chunks.append(current)
+            current = ""
+            current_w = 0.0
+
+        current += ch
+        current_w += w
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+# one match per word, together with the whitespace before it
+GAP_AND_WORD = re.compile(r"(\s*)(\S+)")
+
+
+def break_line(line, font, size, max_width):
+    """
+    Greedy line breaking by real glyph widths.
+    Inner runs of spaces (ljust padding) are kept,
+    spaces at wrapped line edges are dropped like textwrap does
+    """
+    widths = width_table(font, size)
+    space_w = widths[" "]
+
+    lines = []
+    parts = []          # gap + word pieces of the current line
+    has_word = False
+    current_w = 0.0
+
+    for gap, word in GAP_AND_WORD.findall(line.expandtabs()):
+        try:
+            word_w = sum(map(widths.__getitem__, word))
+        except KeyError:
+            word_w = text_width(word, font, size)
+
+        if gap != " ":
+            gap = " " * len(gap)
+
+        if word_w > max_width:
+            if has_word:
+                lines.append("".join(parts))
+            chunks = split_long_word(word, font, size, max_width)
+            lines.extend(chunks[:-1])
+            parts = [chunks[-1]]
+            has_word = True
+            current_w = text_width(chunks[-1], font, size)
+        elif has_word:
+            gap_w = space_w * len(gap)
+            if current_w + gap_w + word_w > max_width:
+                lines.append("".join(parts))
+                parts = [word]
+                current_w = word_w
+            else:
+                parts.append(gap + word)
+                current_w += gap_w + word_w
+        elif lines:
+            # whitespace at the start of a wrapped line is dropped
+            parts = [word]
+            has_word = True
+            current_w = word_w
+        else:
+            parts = [gap + word]
+            has_word = True
+            current_w = space_w * len(gap) + word_w
+
+    if has_word:
+        lines.append("".join(parts))
+
+    return lines or [""]
+
+
+# ================= PARAGRAPH LAYOUT =================
+def layout_lines(text, font, size, max_width):
+    """
+    Lay out text into (font, line) pairs
+    """
+    result = []
+
+    for raw_line in text.split("\n"):
+        line_font = font_for_line(raw_line, font)
+        for line in break_line(raw_line, line_font, size, max_width):
+            result.append((line_font, line))
+
+    return tuple(result)
+
+
+@lru_cache(maxsize=8)
+def layout_boilerplate(text, font, size, max_width):
+    """
+    Memoized layout for the fixed blocks (notes, disclaimers).
+    Per-case text is never repeated, so it is not cached
+    """
+    return layout_lines(text, font, size, max_width)
+
+
+# ================= BENCHMARK =================
+if __name__ == "__main__":
+    import timeit
+    from textwrap import wrap
+
+    from pdf_generator import MAX_WIDTH
+
+    FONT, SIZE = "Times-Roman", 10.5
+
+    incident = (
+        "On the evening of the incident the complainant received a call from an "
+        "unknown number claiming to be a bank official, who asked for the OTP "
+        "sent to the registered mobile number. Believing the caller, the "
+        "complainant shared the OTP and shortly afterwards noticed three "
+        "unauthorised debits from the savings account. "
+    )
+    texts = [incident * n for n in (10, 50, 200)]
+
+    def old_wrapper(text):
+        max_chars = int(MAX_WIDTH / (SIZE * 0.55))
+        return [w for line in text.split("\n") for w in (wrap(line, max_chars) or [""])]
+
+    def new_layout(text):
+        return layout_lines(text, FONT, SIZE, MAX_WIDTH)
+
+    def best_of(fn):
+        # min over repeats, single runs are too noisy on shared machines
+        return min(timeit.repeat(fn, number=10, repeat=7)) / 10
+
+    for text in texts:
+        old_t = best_of(lambda: old_wrapper(text))
+        new_t = best_of(lambda: new_layout(text))
+
+        overflow = sum(
+            1 for line in old_wrapper(text) if text_width(line, FONT, SIZE) > MAX_WIDTH
+        )
+
+        print(
+            f"{len(text):>7} chars | textwrap {old_t * 1000:7.2f} ms, "
+            f"{len(old_wrapper(text))} lines ({overflow} overflowing) "
+            f"| layout {new_t * 1000:7.2f} ms, {len(new_layout(text))} lines"
+        )